@@ -0,0 +1,34 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Fused lowercase + tokenize + count in one native pass over a byte buffer.
+
+Optional compiled fast path for BookDataset; book_dataset.py falls back to
+the regex pipeline when this module isn't built. Build in place with:
+
+    pip install cython
+    cythonize -i _tokcount.pyx
+"""
+
+
+def tokcount(const unsigned char[::1] buf):
+    """Count lowercased [a-zA-Z]+ runs in buf, as a dict of bytes -> int."""
+    cdef Py_ssize_t i = 0, n = buf.shape[0], s
+    cdef unsigned char c
+    cdef dict counts = {}
+
+    while i < n:
+        c = buf[i]
+        if 65 <= c <= 90 or 97 <= c <= 122:
+            # Letter run: scan to its end, then count the lowercased word
+            s = i
+            i += 1
+            while i < n:
+                c = buf[i]
+                if not (65 <= c <= 90 or 97 <= c <= 122):
+                    break
+                i += 1
+            word = bytes(buf[s:i]).lower()
+            counts[word] = counts.get(word, 0) + 1
+        else:
+            i += 1
+
+    return counts
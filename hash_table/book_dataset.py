@@ -1,5 +1,48 @@
+import mmap
+import os
 import re
-import urllib.request
+import shutil
+import urllib3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from operator import iadd
+
+# Shared connection pool: keep-alive lets any future multi-file fetches
+# reuse the same connection
+_POOL = urllib3.PoolManager(maxsize=4)
+
+try:
+    # google-re2: linear-time DFA matching, no backtracking — noticeably
+    # faster than re on plain ASCII class scans. Optional dependency.
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Compiled once at import; \b anchors are redundant since the character
+# class already excludes every non-letter. Bytes pattern: the scan runs
+# on ASCII bytes, skipping the regex engine's Unicode machinery.
+_WORD_RE = _re.compile(rb'[a-zA-Z]+')
+
+try:
+    # Optional compiled fast path: one native pass fusing lowercase,
+    # tokenize and count (see _tokcount.pyx for build instructions)
+    from _tokcount import tokcount
+except ImportError:
+    tokcount = None
+
+# Below this body size, spinning up worker processes costs more than the scan
+_MIN_PARALLEL_BYTES = 1 << 20
+
+
+def _count_chunk(chunk):
+    """Count lowercased word occurrences in one chunk of the body.
+
+    Module-level so the process pool can pickle it by reference.
+    """
+    if tokcount is not None:
+        return Counter(tokcount(chunk))
+    return Counter(m.group(0).lower() for m in _WORD_RE.finditer(chunk))
 
 
 class BookDataset:
@@ -11,11 +54,19 @@ class BookDataset:
     
     def create(self):
         """Download book and create word frequency map."""
-        content = self._download_book()
-        words = self._extract_words(content)
-        self.word_freq = self._create_frequency_map(words)
-        
-        print(f"Total words: {len(words)}")
+        self._download_book()
+        # Memory-map the saved book so the regex scans the OS page cache
+        # directly instead of a full in-memory copy of the text
+        with open(self.output_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, end = self._body_bounds(mm)
+                counts = self._create_frequency_map(mm, start, end)
+        # Decode keys back to str only now, when the vocabulary is ~10x
+        # smaller than the token stream
+        self.word_freq = Counter({word.decode('ascii'): freq
+                                  for word, freq in counts.items()})
+
+        print(f"Total words: {sum(self.word_freq.values())}")
         print(f"Unique words: {len(self.word_freq)}")
         
         return self.word_freq
@@ -23,42 +74,78 @@ class BookDataset:
     # === Helper Methods ============================================================
 
     def _download_book(self):
-        """Download the book from Project Gutenberg."""
+        """Download the book from Project Gutenberg, streaming it to disk."""
         print(f"Downloading book from {self.url}...")
+        tmp_file = self.output_file + '.part'
         try:
-            with urllib.request.urlopen(self.url) as response:
-                content = response.read().decode('utf-8')
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            response = _POOL.request('GET', self.url, preload_content=False)
+            try:
+                # Unlike urlopen, PoolManager.request doesn't raise on HTTP
+                # error statuses — turn them into the fallback path so an
+                # error page never replaces a valid local copy
+                if response.status >= 400:
+                    raise urllib3.exceptions.HTTPError(
+                        f"HTTP {response.status} for {self.url}")
+                # Stream into a temp file so a mid-download failure can't
+                # truncate an existing local copy
+                with open(tmp_file, 'wb') as f:
+                    shutil.copyfileobj(response, f, length=65536)
+            finally:
+                response.release_conn()
+            os.replace(tmp_file, self.output_file)
             print(f"Book saved to {self.output_file}")
         except Exception as e:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             print(f"Error: {e}. Reading from local file...")
-            with open(self.output_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        return content
     
-    def _extract_words(self, text):
+    def _body_bounds(self, text):
+        """Locate the body of the book between the Gutenberg markers."""
+        # C-level substring search instead of splitting the text into lines
+        s = text.find(b'START OF THE PROJECT GUTENBERG EBOOK')
+        start = text.find(b'\n', s) + 1 if s != -1 else 0
+
+        e = text.rfind(b'END OF THE PROJECT GUTENBERG EBOOK')
+        end = e if e != -1 else len(text)
+
+        return start, end
+
+    def _extract_words(self, text, start, end):
         """Extract words from text."""
-        lines = text.split('\n')
-        start_idx = 0
-        end_idx = len(lines)
-        
-        for i, line in enumerate(lines):
-            if 'START OF THE PROJECT GUTENBERG EBOOK' in line:
-                start_idx = i + 1
-                break
-        
-        for i in range(len(lines) - 1, -1, -1):
-            if 'END OF THE PROJECT GUTENBERG EBOOK' in lines[i]:
-                end_idx = i
-                break
-        
-        text = '\n'.join(lines[start_idx:end_idx])
-        return re.findall(r'\b[a-zA-Z]+\b', text.lower())
-    
-    def _create_frequency_map(self, words):
-        """Create word frequency map."""
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        return word_freq
\ No newline at end of file
+        # The mmap is read-only, so lowercase per token (each a few bytes)
+        # rather than copying the whole body out just to case-fold it
+        return (m.group(0).lower()
+                for m in _WORD_RE.finditer(text, start, end))
+
+    def _create_frequency_map(self, text, start, end):
+        """Create word frequency map, tokenizing large bodies in parallel."""
+        if end - start < _MIN_PARALLEL_BYTES or os.cpu_count() == 1:
+            if tokcount is not None:
+                # memoryview slicing is zero-copy, even over the mmap
+                return Counter(tokcount(memoryview(text)[start:end]))
+            # Counter counts in C, avoiding a Python-level loop per word
+            return Counter(self._extract_words(text, start, end))
+
+        # Tokenization is data-parallel: scan one chunk per core in its own
+        # process (sidestepping the GIL) and merge the per-chunk counts --
+        # the merge is only O(unique words)
+        chunks = self._split_chunks(text, start, end)
+        with ProcessPoolExecutor() as pool:
+            return reduce(iadd, pool.map(_count_chunk, chunks), Counter())
+
+    def _split_chunks(self, text, start, end):
+        """Split the body into roughly one chunk per core, aligned to newlines."""
+        step = max((end - start) // (os.cpu_count() or 1), 1)
+        chunks = []
+        lo = start
+
+        while lo < end:
+            hi = min(lo + step, end)
+            if hi < end:
+                # Never split mid-word: extend to the next line break
+                nl = text.find(b'\n', hi, end)
+                hi = nl + 1 if nl != -1 else end
+            chunks.append(text[lo:hi])
+            lo = hi
+
+        return chunks
@@ -1,146 +1,126 @@
+from collections import OrderedDict
+
+# Tombstone marking a deleted slot: probes walk past it, inserts reuse it
+_DUMMY = object()
+
+
 class Node:
+    # No per-instance __dict__: smaller nodes, direct C-struct attribute access
+    __slots__ = ('key', 'value')
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
-        self.prev = None
-        self.next = None
 
 
 class FixedHashTable:
-    
+
     def __init__(self, size):
         self.size = size
-        self.table = [None] * size  # Each entry: None or Node
+        self.table = [None] * size  # Each entry: None, _DUMMY or Node
         self.count = 0
-        self.head = None  # Oldest (first inserted/updated)
-        self.tail = None  # Newest (most recently inserted/updated)
-        
+        self.tombstones = 0
+        self._order = OrderedDict()  # Keys, oldest first; values unused
+
     def insert(self, key, value):
-        idx = self._find_slot(key)
-        
-        if self.table[idx] is not None and self.table[idx].key == key:
+        idx, node = self._find_slot(key)
+
+        if node is not None:
             # Update existing
-            node = self.table[idx]
             node.value = value
-            # Update history - move to end
-            self._move_to_end(node)
+            # Update history - move to end (single C call)
+            self._order.move_to_end(key)
         else:
             # New insertion
             if self.count >= self.size:
                 raise Exception("Hash table is full")
-            
-            node = Node(key, value)
-            self.table[idx] = node
-            self._add_to_end(node)
+
+            if self.table[idx] is _DUMMY:
+                # Reusing a tombstoned slot
+                self.tombstones -= 1
+            self.table[idx] = Node(key, value)
+            self._order[key] = None
             self.count += 1
-    
+
     def remove(self, key):
-        idx = self._find_slot(key)
-        
-        if self.table[idx] is None or self.table[idx].key != key:
+        idx, node = self._find_slot(key)
+
+        if node is None:
             raise KeyError(f"Key '{key}' not found")
-        
-        node = self.table[idx]
-        self._remove_node(node)
-        self.table[idx] = None
+
+        del self._order[key]
+        # O(1) delete: leave a tombstone so probe chains stay intact
+        self.table[idx] = _DUMMY
         self.count -= 1
-        
-        # Rehash all entries in the cluster that follows
-        self._rehash_cluster(idx)
-    
+        self.tombstones += 1
+
+        # Don't let tombstones degrade probing: rebuild past 1/3 capacity
+        if self.tombstones * 3 > self.size:
+            self._compact()
+
     def get(self, key):
-        idx = self._find_slot(key)
-        
-        if self.table[idx] is None or self.table[idx].key != key:
+        _, node = self._find_slot(key)
+
+        if node is None:
             raise KeyError(f"Key '{key}' not found")
-        
-        return self.table[idx].value
-    
+
+        return node.value
+
     def get_first(self):
-        if self.head is None:
+        if not self._order:
             return None
-        return (self.head.key, self.head.value)
+        key = next(iter(self._order))
+        return (key, self.get(key))
 
     def get_last(self):
-        if self.tail is None:
+        if not self._order:
             return None
-        return (self.tail.key, self.tail.value)
-    
+        key = next(reversed(self._order))
+        return (key, self.get(key))
+
     # === Helper Methods ============================================================
-    
+
     def _hash(self, key):
         """Hash function."""
         return hash(key) % self.size
-    
+
     def _find_slot(self, key):
-        """Find slot for key using linear probing."""
+        """Find slot for key using linear probing.
+
+        Returns (idx, node): the key's slot and its Node if present,
+        otherwise the first reusable slot (tombstone or empty) and None.
+        Callers branch on node instead of re-probing the table.
+        """
+        # Local bindings keep attribute lookups out of the hot probe loop
+        table = self.table
+        size = self.size
         idx = self._hash(key)
         start_idx = idx
-        
-        while self.table[idx] is not None:
-            if self.table[idx].key == key:
-                return idx
-            
-            idx = (idx + 1) % self.size
-            
+        first_free = -1
+
+        while table[idx] is not None:
+            node = table[idx]
+            if node is _DUMMY:
+                # Deleted slot: reusable for insert, but keep probing
+                if first_free == -1:
+                    first_free = idx
+            elif node.key == key:
+                return idx, node
+
+            idx = (idx + 1) % size
+
             # Checked the whole table
             if idx == start_idx:
                 break
-        
-        return idx
-    
-    def _rehash_cluster(self, start_idx):
-        """Rehash entries after a deletion to maintain probe sequences."""
-        idx = (start_idx + 1) % self.size
-        
-        while self.table[idx] is not None:
-            # Save the node (don't touch linked list yet)
-            node = self.table[idx]
-            
-            # Remove from table only
-            self.table[idx] = None
-            self.count -= 1
-            
-            # Find new slot and reinsert without changing linked list order
-            new_idx = self._find_slot(node.key)
-            self.table[new_idx] = node
-            self.count += 1
-            
-            idx = (idx + 1) % self.size
-            
-            if idx == start_idx:
-                break
-    
-    def _remove_node(self, node):
-        """Remove node from linked list."""
-        if node.prev:
-            node.prev.next = node.next
-        else:
-            self.head = node.next
-            
-        if node.next:
-            node.next.prev = node.prev
-        else:
-            self.tail = node.prev
-    
-    def _add_to_end(self, node):
-        """Add node to end of linked list."""
-        if self.tail is None:
-            # Empty list
-            self.head = self.tail = node
-        else:
-            # Add to end
-            self.tail.next = node
-            node.prev = self.tail
-            node.next = None
-            self.tail = node
-    
-    def _move_to_end(self, node):
-        """Move existing node to end of linked list."""
-        if node == self.tail:
-            return  # Already at end
-        
-        # Remove from current position
-        self._remove_node(node)
-        # Add to end
-        self._add_to_end(node)
\ No newline at end of file
+
+        return (first_free if first_free != -1 else idx), None
+
+    def _compact(self):
+        """Rebuild the table in place to clear accumulated tombstones."""
+        nodes = [n for n in self.table if n is not None and n is not _DUMMY]
+        self.table = [None] * self.size
+        self.tombstones = 0
+
+        for node in nodes:
+            idx, _ = self._find_slot(node.key)
+            self.table[idx] = node
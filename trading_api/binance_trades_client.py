@@ -1,41 +1,85 @@
+import asyncio
+import sys
+import threading
 import time
-import websocket
-import json
+import websockets
+import operator
 from typing import Dict, Callable, Optional
 
+try:
+    # Rust-based parser, ~10x faster per frame than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class BinanceTradesClient:
     """Client for Binance USD(S)-M Futures API."""
     
     WS_URL = "wss://fstream.binance.com/ws"
-    
+
+    # aggTrade fields and their expected types, in one fixed order so all
+    # seven values come out of the dict in a single C call
+    _KEYS = ("a", "p", "q", "f", "l", "T", "m")
+    _GET = operator.itemgetter(*_KEYS)
+    _TYPES = (int, str, str, int, int, int, bool)
+
     def __init__(self, symbol: str = "BTCUSDT"):
         self.symbol = symbol
     
     def stream_trades(self, callback: Callable[[Dict], None], duration: float = 10):
         """
         Stream trades in real-time via WebSocket.
-        
+
         Args:
             callback: Function to call for each trade
             duration: Duration in seconds
         """
+        coro = self._stream_trades(callback, duration)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop in this thread (plain script): drive the coroutine here
+            asyncio.run(coro)
+        else:
+            # A loop is already running (e.g. a notebook kernel), where
+            # asyncio.run() raises — run the coroutine on its own thread's
+            # loop instead so this entry point stays synchronous everywhere
+            thread = threading.Thread(target=asyncio.run, args=(coro,))
+            thread.start()
+            thread.join()
+
+    async def _stream_trades(self, callback: Callable[[Dict], None], duration: float):
+        """Receive frames on the async websockets client (frame parsing in C)."""
         ws_endpoint = f"{self.WS_URL}/{self.symbol.lower()}@aggTrade"
         print(f"Connecting to: {ws_endpoint}")
-        
+
         try:
-            ws = websocket.create_connection(ws_endpoint)
-            print(f"Streaming {self.symbol} trades...")
-            
-            start_time = time.time()
-            while time.time() - start_time < duration:
-                message = ws.recv()
-                trade = json.loads(message)
-                callback(trade)
-            
-            ws.close()
+            # compression=None: per-message deflate is pure CPU burn for
+            # already-short JSON frames
+            async with websockets.connect(ws_endpoint, compression=None) as ws:
+                print(f"Streaming {self.symbol} trades...")
+
+                # Bind hot names to locals: at thousands of frames/sec the
+                # per-iteration module/attribute lookups add up
+                monotonic = time.monotonic
+                wait_for = asyncio.wait_for
+                recv = ws.recv
+                loads = _json_loads
+
+                deadline = monotonic() + duration
+                while True:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        message = await wait_for(recv(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    callback(loads(message))
+
             print("WebSocket closed")
-            
+
         except Exception as e:
             print(f"WebSocket error: {e}")
     
@@ -49,30 +93,19 @@ class BinanceTradesClient:
             Parsed trade dict if valid, None otherwise
         """
         try:
-            # Validate all required fields exist and have correct types
-            if not (
-                isinstance(trade.get("a"), int) and
-                isinstance(trade.get("p"), str) and
-                isinstance(trade.get("q"), str) and
-                isinstance(trade.get("f"), int) and
-                isinstance(trade.get("l"), int) and
-                isinstance(trade.get("T"), int) and
-                isinstance(trade.get("m"), bool)
-            ):
-                return None
-            
-            # Return the parsed trade (already in correct format from JSON)
-            return {
-                "a": trade["a"],  # Aggregate tradeId
-                "p": trade["p"],  # Price
-                "q": trade["q"],  # Quantity
-                "f": trade["f"],  # First tradeId
-                "l": trade["l"],  # Last tradeId
-                "T": trade["T"],  # Timestamp
-                "m": trade["m"]   # Was buyer the maker?
-            }
+            # Extract all seven fields in one C call
+            values = self._GET(trade)
         except (KeyError, TypeError):
             return None
+
+        # Exact type check per position; type(x) is t beats isinstance for
+        # exact matches and rejects bool-for-int JSON oddities
+        if not all(type(v) is t for v, t in zip(values, self._TYPES)):
+            return None
+
+        # The validated input is already in the correct format from JSON;
+        # rebuilding it key-by-key would just redo seven dict inserts
+        return trade
     
     def measure_parsing_speed(self, duration: float = 5) -> Dict:
         """Measure parsing performance on live stream."""
@@ -89,10 +122,10 @@ class BinanceTradesClient:
         if not trades:
             return {}
         
-        # Measure parsing time
+        # Measure parsing time: map/filter run as C-level iterators, so the
+        # trades are parsed and counted in a single pass with no result list
         parse_start = time.perf_counter()
-        parsed_trades = [self.parse_trade(t) for t in trades]
-        valid_count = sum(1 for t in parsed_trades if t is not None)
+        valid_count = sum(1 for _ in filter(None, map(self.parse_trade, trades)))
         parse_time = time.perf_counter() - parse_start
         
         count = len(trades)
@@ -121,14 +154,18 @@ class BinanceTradesClient:
     
     def print_trade(self, trade: Dict):
         """Print trade in assignment format."""
-        print("[")
-        print("  {")
-        print(f'    "a": {trade["a"]},')
-        print(f'    "p": "{trade["p"]}",')
-        print(f'    "q": "{trade["q"]}",')
-        print(f'    "f": {trade["f"]},')
-        print(f'    "l": {trade["l"]},')
-        print(f'    "T": {trade["T"]},')
-        print(f'    "m": {str(trade["m"]).lower()}')
-        print("  }")
-        print("]")
+        # One write instead of 10 print calls: stdout is locked and flushed
+        # once per trade rather than per line
+        sys.stdout.write(
+            '[\n'
+            '  {\n'
+            f'    "a": {trade["a"]},\n'
+            f'    "p": "{trade["p"]}",\n'
+            f'    "q": "{trade["q"]}",\n'
+            f'    "f": {trade["f"]},\n'
+            f'    "l": {trade["l"]},\n'
+            f'    "T": {trade["T"]},\n'
+            f'    "m": {"true" if trade["m"] else "false"}\n'
+            '  }\n'
+            ']\n'
+        )